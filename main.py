@@ -41,6 +41,7 @@ def main():
     os.environ["APP_ENV"] = "production"
     print(f"\nSet APP_ENV to: '{os.environ['APP_ENV']}'\n")
 
+    config = None
     try:
         # 4. Instantiate the configuration class.
         # typedconf will now load and merge the files and environment variables.
@@ -66,7 +67,12 @@ def main():
     os.environ["APP_ENV"] = "development"
     print(f"\nSwitched APP_ENV to: '{os.environ['APP_ENV']}'\n")
     try:
-        config = CustomAppConfig()
+        # Rebuild the production config for the new environment, keeping the
+        # arguments it was constructed with.
+        if config is not None:
+            config = config.reconfigure(os.environ["APP_ENV"])
+        else:
+            config = CustomAppConfig()
         print("\n--- Final Configuration (Development) ---")
         pprint.pprint(config.model_dump())
         print("-----------------------------------------\n")
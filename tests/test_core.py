@@ -1,8 +1,17 @@
+import asyncio
+import sys
+
 import pytest
 from typing import Any, Mapping
 from unittest.mock import MagicMock
 
-from typedconf.config.core import deep_merge, load_sources, ConfigLoader
+from typedconf.config.core import (
+    ConfigLoader,
+    deep_merge,
+    load_sources,
+    load_sources_async,
+    load_sources_cached,
+)
 
 
 class TestDeepMerge:
@@ -50,6 +59,29 @@ class TestDeepMerge:
         assert destination["a"]["x"] == 1  # Destination should remain unchanged
 
 
+    def test_nested_source_copy(self):
+        """Nested dicts are copied too, so later merges never write into the source."""
+        source = {"a": {"b": {"x": 1}}}
+        destination = {}
+        deep_merge(source, destination)
+        deep_merge({"a": {"b": {"x": 2}}}, destination)
+
+        assert destination == {"a": {"b": {"x": 2}}}
+        assert source == {"a": {"b": {"x": 1}}}
+
+    def test_deeply_nested_merge(self):
+        """Nesting deeper than the recursion limit should still merge."""
+        depth = sys.getrecursionlimit() + 100
+        source, destination = {"leaf": 1}, {"leaf": 0, "kept": True}
+        for _ in range(depth):
+            source, destination = {"n": source}, {"n": destination}
+
+        result = deep_merge(source, destination)
+        for _ in range(depth):
+            result = result["n"]
+        assert result == {"leaf": 1, "kept": True}
+
+
 class MockLoader(ConfigLoader):
     def __init__(self, data: dict, should_fail: bool = False):
         self.data = data
@@ -86,3 +118,84 @@ class TestLoadSources:
     def test_empty_sources(self):
         result = load_sources([])
         assert result == {}
+
+
+class KeyedLoader(MockLoader):
+    """MockLoader with a cache key and a count of load() calls."""
+
+    def __init__(self, data: dict, key):
+        super().__init__(data)
+        self.key = key
+        self.calls = 0
+
+    def load(self) -> Mapping[str, Any]:
+        self.calls += 1
+        return super().load()
+
+    def cache_key(self):
+        return self.key
+
+
+class TestLoadSourcesCached:
+    def test_reuses_result_while_keys_unchanged(self):
+        loader = KeyedLoader({"a": {"b": 1}}, key=("reuse", 1))
+        first = load_sources_cached([loader])
+        first["a"]["b"] = 2  # Callers get their own copy
+        second = load_sources_cached([loader])
+
+        assert second == {"a": {"b": 1}}
+        assert loader.calls == 1
+
+    def test_reloads_when_key_changes(self):
+        loader = KeyedLoader({"a": 1}, key=("reload", 1))
+        load_sources_cached([loader])
+        loader.key, loader.data = ("reload", 2), {"a": 2}
+
+        assert load_sources_cached([loader]) == {"a": 2}
+        assert loader.calls == 2
+
+    def test_failed_load_is_not_cached(self):
+        loader = KeyedLoader({"a": 1}, key=("failed", 1))
+        loader.should_fail = True
+        load_sources_cached([loader])
+        loader.should_fail = False
+
+        assert load_sources_cached([loader]) == {"a": 1}
+        assert loader.calls == 2
+
+    def test_uncacheable_source_always_loads(self):
+        keyed = KeyedLoader({"a": 1}, key=("uncacheable", 1))
+        result = load_sources_cached([keyed, MockLoader({"b": 2})])
+        load_sources_cached([keyed, MockLoader({"b": 2})])
+
+        assert result == {"a": 1, "b": 2}
+        assert keyed.calls == 2
+
+
+class TestLoadSourcesAsync:
+    def test_load_multiple_sources_order(self):
+        """Later sources should override earlier ones."""
+        loader1 = MockLoader({"a": 1, "b": {"x": 1}})
+        loader2 = MockLoader({"a": 2, "b": {"y": 2}})
+        result = asyncio.run(load_sources_async([loader1, loader2]))
+        assert result == {"a": 2, "b": {"x": 1, "y": 2}}
+
+    def test_load_with_failure(self):
+        loader1 = MockLoader({"a": 1})
+        loader2 = MockLoader({}, should_fail=True)
+        result = asyncio.run(load_sources_async([loader1, loader2]))
+        assert result == {"a": 1}
+
+    def test_non_exception_is_raised(self):
+        """Errors that aren't Exceptions must propagate, not be logged as load failures."""
+
+        class Abort(BaseException):
+            pass
+
+        failing = MockLoader({})
+        failing.load = MagicMock(side_effect=Abort)
+        with pytest.raises(Abort):
+            asyncio.run(load_sources_async([MockLoader({"a": 1}), failing]))
+
+    def test_empty_sources(self):
+        assert asyncio.run(load_sources_async([])) == {}
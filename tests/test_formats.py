@@ -1,6 +1,7 @@
 import pytest
 from pathlib import Path
-from typedconf.config.formats import TomlFileLoader
+from typedconf.config.core import load_sources_cached
+from typedconf.config.formats import TomlFileLoader, _parse_cache_size_from_env
 
 class TestTomlFileLoader:
     def test_load_valid_toml(self, tmp_path):
@@ -38,3 +39,101 @@ class TestTomlFileLoader:
         data = loader.load()
         
         assert data == {}
+
+    def test_unchanged_file_is_parsed_once(self, tmp_path):
+        """Test that reloading an unchanged file is served from the parse cache."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('key = "value"')
+        calls = []
+
+        def parser(raw):
+            calls.append(raw)
+            return {"key": "value"}
+
+        first = TomlFileLoader(config_file, parser=parser).load()
+        second = TomlFileLoader(config_file, parser=parser).load()
+
+        assert second == first
+        assert len(calls) == 1
+
+    def test_cached_load_returns_independent_data(self, tmp_path):
+        """Test that mutating nested tables from one load doesn't affect the next."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("[section]\nfoo = 123")
+
+        TomlFileLoader(config_file).load()["section"]["foo"] = 42
+
+        assert TomlFileLoader(config_file).load() == {"section": {"foo": 123}}
+
+    def test_modified_file_is_reparsed(self, tmp_path):
+        """Test that changing a file invalidates its cached parse."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('key = "value"')
+        assert TomlFileLoader(config_file).load() == {"key": "value"}
+
+        config_file.write_text('key = "changed"')
+        assert TomlFileLoader(config_file).load() == {"key": "changed"}
+
+    def test_custom_parser(self, tmp_path):
+        """Test that a custom parser receives the raw file bytes."""
+        config_file = tmp_path / "config.toml"
+        config_file.write_text("ignored")
+
+        loader = TomlFileLoader(config_file, parser=lambda raw: {"raw": raw})
+        assert loader.load() == {"raw": b"ignored"}
+
+    def test_load_memory_mapped(self, tmp_path, monkeypatch):
+        """Test that files above the mmap threshold parse the same way."""
+        monkeypatch.setattr("typedconf.config.formats._MMAP_THRESHOLD", 1)
+        config_file = tmp_path / "config.toml"
+        config_file.write_text('key = "value"\n[section]\nfoo = 123')
+
+        data = TomlFileLoader(config_file).load()
+
+        assert data == {"key": "value", "section": {"foo": 123}}
+
+    def test_cache_key_tracks_file_state(self, tmp_path):
+        """Test that the cache key changes when the file is created or edited."""
+        config_file = tmp_path / "config.toml"
+        loader = TomlFileLoader(config_file)
+        missing_key = loader.cache_key()
+
+        config_file.write_text('key = "value"')
+        created_key = loader.cache_key()
+        config_file.write_text('key = "changed"')
+
+        assert len({missing_key, created_key, loader.cache_key()}) == 3
+
+
+    def test_invalid_toml_warns_on_every_cached_load(self, tmp_path, caplog):
+        """Test that a parse failure is not cached, so each load reports it again."""
+        config_file = tmp_path / "invalid.toml"
+        config_file.write_text("broken_line")
+        sources = [TomlFileLoader(config_file)]
+
+        load_sources_cached(sources)
+        load_sources_cached(sources)
+
+        warnings = [r for r in caplog.records if "Failed to load or parse" in r.message]
+        assert len(warnings) == 2
+
+    def test_missing_required_file_errors_on_every_cached_load(self, tmp_path, caplog):
+        """Test that a missing required file is not cached, so each load reports it again."""
+        sources = [TomlFileLoader(tmp_path / "missing.toml", required=True)]
+
+        load_sources_cached(sources)
+        load_sources_cached(sources)
+
+        errors = [r for r in caplog.records if "Required config file not found" in r.message]
+        assert len(errors) == 2
+
+
+class TestParseCacheSize:
+    def test_valid_size(self, monkeypatch):
+        monkeypatch.setenv("TYPEDCONF_PARSE_CACHE_SIZE", "16")
+        assert _parse_cache_size_from_env() == 16
+
+    @pytest.mark.parametrize("value", ["lots", "-1", ""])
+    def test_invalid_size_falls_back_to_default(self, monkeypatch, value):
+        monkeypatch.setenv("TYPEDCONF_PARSE_CACHE_SIZE", value)
+        assert _parse_cache_size_from_env() == 128
@@ -0,0 +1,157 @@
+import inspect
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from typedconf.config.formats import TomlFileLoader
+from typedconf.config.models import AppConfig, LanguageModelConfig
+from typedconf.config.schema import ValidationError
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    """Fixture for a working directory holding default and production config files."""
+    (tmp_path / "config.default.toml").write_text(
+        "[model]\n"
+        'id = "gpt-3.5-turbo"\n'
+        "top_p = 0.1\n"
+    )
+    (tmp_path / "config.production.toml").write_text(
+        'app_name = "ProdApp"\n'
+        "[model]\n"
+        "top_p = 0.5\n"
+    )
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("APP_ENV", "development")
+    return tmp_path
+
+
+class TestLanguageModelConfig:
+    def test_frozen(self):
+        """Test that the config is immutable and hashable."""
+        model_config = LanguageModelConfig(id="gpt-3.5-turbo")
+        with pytest.raises(ValidationError):
+            model_config.temperature = 0.0
+        assert hash(model_config) == hash(model_config.model_copy())
+
+
+class TestAppConfig:
+    def test_load_for_environment(self, config_dir, monkeypatch):
+        """Test that the environment file overrides the default file."""
+        monkeypatch.setenv("APP_ENV", "production")
+        config = AppConfig()
+
+        assert config.app_name == "ProdApp"
+        assert config.model.id == "gpt-3.5-turbo"
+        assert config.model.top_p == 0.5
+
+    def test_subclass_config_sources(self, config_dir):
+        """Test that a subclass's own config_sources replace the default files."""
+        (config_dir / "custom.toml").write_text('app_name = "CustomApp"\n[model]\nid = "custom"\n')
+
+        class CustomConfig(AppConfig):
+            config_sources = [TomlFileLoader("custom.toml", required=True)]
+
+        config = CustomConfig()
+
+        assert config.app_name == "CustomApp"
+        assert config.model.id == "custom"
+        assert AppConfig().app_name == "MyCoolApp"
+
+    def test_files_skipped_when_all_fields_given(self, tmp_path, monkeypatch):
+        """Test that config files are not read if init arguments set every field."""
+        monkeypatch.chdir(tmp_path)
+
+        def fail_load(sources):
+            raise AssertionError("config files should not be read")
+
+        monkeypatch.setattr("typedconf.config.models.load_sources_cached", fail_load)
+        config = AppConfig(app_name="InitApp", model=LanguageModelConfig(id="init-model"))
+
+        assert config.app_name == "InitApp"
+        assert config.model.id == "init-model"
+
+    def test_mutating_loaded_values_does_not_leak(self, config_dir):
+        """Test that mutating one instance's file-loaded values leaves later loads intact."""
+        (config_dir / "config.default.toml").write_text(
+            '[model]\nid = "gpt-3.5-turbo"\n[extra.x]\ny = 1\n'
+        )
+
+        class ExtraConfig(AppConfig):
+            extra: Any = None
+
+        ExtraConfig().extra["x"]["y"] = 999
+
+        assert ExtraConfig().extra == {"x": {"y": 1}}
+
+    def test_reconfigure_matches_fresh_load(self, config_dir, monkeypatch):
+        """Test that reconfigure gives the same result as loading from scratch."""
+        config = AppConfig()
+        reconfigured = config.reconfigure("production")
+
+        monkeypatch.setenv("APP_ENV", "production")
+        assert reconfigured.model_dump() == AppConfig().model_dump()
+        assert config.app_name == "MyCoolApp"  # The original is left untouched
+
+    def test_reconfigure_keeps_env_overrides(self, config_dir, monkeypatch):
+        """Test that values set by environment variables survive reconfigure."""
+        monkeypatch.setenv("APP_MODEL__TOP_P", "0.9")
+        config = AppConfig()
+        reconfigured = config.reconfigure("production")
+
+        assert reconfigured.app_name == "ProdApp"
+        assert reconfigured.model.top_p == 0.9
+
+    def test_reconfigure_back_to_defaults(self, config_dir, monkeypatch):
+        """Test that values only set by the old environment's file are reverted."""
+        monkeypatch.setenv("APP_ENV", "production")
+        config = AppConfig()
+        reconfigured = config.reconfigure("development")
+
+        assert reconfigured.app_name == "MyCoolApp"  # Falls back to the field default
+        assert reconfigured.model.top_p == 0.1
+
+    def test_reconfigure_keeps_env_var_on_key_old_files_lack(self, config_dir, monkeypatch):
+        """Test that an env var beats the new files even if the old files didn't set the key."""
+        monkeypatch.setenv("APP_APP_NAME", "FromEnv")
+        reconfigured = AppConfig().reconfigure("production")
+
+        assert reconfigured.app_name == "FromEnv"
+        assert reconfigured.model.top_p == 0.5
+
+    def test_reconfigure_keeps_init_arguments(self, config_dir):
+        """Test that constructor arguments beat the new environment's files."""
+        reconfigured = AppConfig(app_name="FromInit").reconfigure("production")
+
+        assert reconfigured.app_name == "FromInit"
+        assert reconfigured.model.top_p == 0.5
+
+    def test_reconfigure_updates_coerced_fields(self, config_dir, monkeypatch):
+        """Test that fields whose type differs from the raw TOML value are updated."""
+        with open(config_dir / "config.default.toml", "a") as f:
+            f.write('[paths]\ndata_dir = "/a"\n')
+        (config_dir / "config.production.toml").write_text('[paths]\ndata_dir = "/b"\n')
+
+        class PathsConfig(AppConfig):
+            paths: dict[str, Path]
+
+        reconfigured = PathsConfig().reconfigure("production")
+
+        monkeypatch.setenv("APP_ENV", "production")
+        assert reconfigured.paths["data_dir"] == Path("/b")
+        assert reconfigured.model_dump() == PathsConfig().model_dump()
+
+    def test_reconfigure_leaves_app_env_untouched(self, config_dir):
+        """Test that reconfigure does not change the environment used by later loads."""
+        AppConfig().reconfigure("production")
+
+        assert AppConfig().app_name == "MyCoolApp"
+
+    def test_signature_keeps_fields_and_settings_arguments(self, config_dir):
+        """Test that capturing init arguments doesn't hide pydantic's generated signature."""
+        AppConfig()  # The signature includes the fields once the model is built
+
+        parameters = inspect.signature(AppConfig).parameters
+
+        assert {"app_name", "model", "_env_file"} <= parameters.keys()
@@ -2,6 +2,7 @@ import pytest
 from unittest.mock import MagicMock, patch
 
 from typedconf import ChatMessage, LanguageModelConfig, MessageRole, OpenAILanguageModel
+from typedconf.core.openai_model import _shared_client
 
 
 @pytest.fixture
@@ -18,9 +19,11 @@ def model_config():
 @pytest.fixture
 def mock_openai_client():
     """Fixture for mocked OpenAI client."""
+    _shared_client.cache_clear()
     with patch("openai.Client") as MockClient:
         mock_instance = MockClient.return_value
         yield mock_instance
+    _shared_client.cache_clear()
 
 
 class TestOpenAILanguageModel:
@@ -38,6 +41,28 @@ class TestOpenAILanguageModel:
         assert model.model_config == model_config
         assert model.client == mock_openai_client
 
+    def test_init_shares_client(self, model_config, mock_openai_client):
+        """Test that models with the same API key share one client."""
+        first = OpenAILanguageModel(model_config=model_config, api_key="test-key")
+        second = OpenAILanguageModel(model_config=model_config, api_key="test-key")
+
+        assert first.client is second.client
+
+    def test_init_without_api_key_does_not_share_client(self, model_config):
+        """Test that models without an explicit key each create their own client."""
+        with patch("openai.Client") as MockClient:
+            OpenAILanguageModel(model_config=model_config)
+            OpenAILanguageModel(model_config=model_config)
+
+        assert MockClient.call_count == 2
+
+    def test_init_with_client(self, model_config, mock_openai_client):
+        """Test that an explicitly passed client is used as-is."""
+        client = MagicMock()
+        model = OpenAILanguageModel(model_config=model_config, client=client)
+
+        assert model.client is client
+
     def test_invoke_basic(self, model_config, mock_openai_client):
         """Test basic invoke functionality."""
         # Setup mock response
@@ -184,3 +209,91 @@ class TestOpenAILanguageModel:
         response = model.invoke(messages)
         
         assert response.usage is None
+
+    def test_invoke_batch(self, model_config, mock_openai_client):
+        """Test that invoke_batch returns one response per conversation, in order."""
+        def create(messages, **kwargs):
+            mock_response = MagicMock()
+            mock_response.choices = [
+                MagicMock(message=MagicMock(content=messages[0]["content"]), finish_reason="stop")
+            ]
+            mock_response.model = "gpt-3.5-turbo"
+            mock_response.usage = None
+            mock_response.system_fingerprint = "fp_123"
+            return mock_response
+
+        mock_openai_client.chat.completions.create.side_effect = create
+
+        model = OpenAILanguageModel(model_config=model_config)
+        conversations = [
+            [ChatMessage(role=MessageRole.USER, content=f"Message {i}")] for i in range(5)
+        ]
+
+        responses = model.invoke_batch(conversations, temperature=0.9)
+
+        assert [r.content for r in responses] == [f"Message {i}" for i in range(5)]
+        for call in mock_openai_client.chat.completions.create.call_args_list:
+            assert call[1]["temperature"] == 0.9
+
+    def test_invoke_cache(self, model_config, mock_openai_client):
+        """Test that temperature 0 responses are served from the cache on repeat."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test"), finish_reason="stop")]
+        mock_response.model = "gpt-3.5-turbo"
+        mock_response.usage = None
+        mock_response.system_fingerprint = "fp_123"
+
+        mock_openai_client.chat.completions.create.return_value = mock_response
+
+        model = OpenAILanguageModel(model_config=model_config, cache={})
+        messages = [ChatMessage(role=MessageRole.USER, content="Hi")]
+
+        first = model.invoke(messages, temperature=0)
+        second = model.invoke(messages, temperature=0)
+        model.invoke([ChatMessage(role=MessageRole.USER, content="Bye")], temperature=0)
+
+        second.metadata["system_fingerprint"] = "changed"  # Hits are independent copies
+        third = model.invoke(messages, temperature=0)
+
+        assert second is not first
+        assert third.content == first.content == "test"
+        assert third.metadata == first.metadata == {"system_fingerprint": "fp_123"}
+        assert mock_openai_client.chat.completions.create.call_count == 2
+
+    def test_invoke_cache_skips_unserializable_params(self, model_config, mock_openai_client):
+        """Test that calls with parameters that aren't plain JSON are not cached."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test"), finish_reason="stop")]
+        mock_response.model = "gpt-3.5-turbo"
+        mock_response.usage = None
+        mock_response.system_fingerprint = "fp_123"
+
+        mock_openai_client.chat.completions.create.return_value = mock_response
+
+        cache = {}
+        model = OpenAILanguageModel(model_config=model_config, cache=cache)
+        messages = [ChatMessage(role=MessageRole.USER, content="Hi")]
+
+        model.invoke(messages, temperature=0, extra_body=object())
+
+        assert cache == {}
+
+    def test_invoke_cache_skips_sampled_calls(self, model_config, mock_openai_client):
+        """Test that calls with a non-zero temperature are never cached."""
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock(message=MagicMock(content="test"), finish_reason="stop")]
+        mock_response.model = "gpt-3.5-turbo"
+        mock_response.usage = None
+        mock_response.system_fingerprint = "fp_123"
+
+        mock_openai_client.chat.completions.create.return_value = mock_response
+
+        cache = {}
+        model = OpenAILanguageModel(model_config=model_config, cache=cache)
+        messages = [ChatMessage(role=MessageRole.USER, content="Hi")]
+
+        model.invoke(messages)
+        model.invoke(messages)
+
+        assert cache == {}
+        assert mock_openai_client.chat.completions.create.call_count == 2
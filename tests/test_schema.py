@@ -0,0 +1,33 @@
+from typedconf.config.schema import Config, ConfigModel, Field
+
+
+class TestDeferredBuild:
+    def test_config_model_builds_on_first_use(self):
+        """Test that a ConfigModel subclass is built on first use and then works normally."""
+
+        class Inner(ConfigModel):
+            name: str
+            size: int = Field(1, ge=0)
+
+        assert Inner.__pydantic_complete__ is False
+
+        inner = Inner(name="x", size="3")
+
+        assert Inner.__pydantic_complete__ is True
+        assert inner.size == 3
+        assert inner.model_dump() == {"name": "x", "size": 3}
+
+    def test_config_builds_on_first_use(self, monkeypatch):
+        """Test that a Config subclass is built on first use and still reads the environment."""
+
+        class Settings(Config):
+            inner: dict[str, int] = {}
+            port: int = 8000
+
+        monkeypatch.setenv("PORT", "9000")
+        assert Settings.__pydantic_complete__ is False
+
+        settings = Settings(inner={"a": "1"})
+
+        assert Settings.__pydantic_complete__ is True
+        assert settings.model_dump() == {"inner": {"a": 1}, "port": 9000}
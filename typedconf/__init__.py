@@ -6,6 +6,8 @@ This package provides:
 - Language model interfaces and implementations
 """
 
+import importlib
+
 # Re-export config public API
 from typedconf.config import (
     AppConfig,
@@ -17,14 +19,15 @@ from typedconf.config import (
     ValidationError,
 )
 
-# Re-export core public API
-from typedconf.core import (
-    ChatMessage,
-    ChatResponse,
-    LanguageModel,
-    MessageRole,
-    OpenAILanguageModel,
-)
+# Core public API is imported lazily (PEP 562): it pulls in the openai client,
+# which config-only users should not pay for at import time.
+_CORE_LAZY = frozenset({
+    "ChatMessage",
+    "ChatResponse",
+    "LanguageModel",
+    "MessageRole",
+    "OpenAILanguageModel",
+})
 
 __version__ = "0.1.0"
 
@@ -44,3 +47,16 @@ __all__ = [
     "MessageRole",
     "OpenAILanguageModel",
 ]
+
+
+def __getattr__(name: str):
+    if name in _CORE_LAZY:
+        value = getattr(importlib.import_module("typedconf.core"), name)
+        # Cache on the module so later lookups skip __getattr__
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | _CORE_LAZY)
@@ -2,20 +2,37 @@
 Core components for loading and merging configuration data.
 """
 import abc
+import asyncio
+import copy
 import logging
+import threading
 import types
+from collections import deque
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Hashable, Mapping, Optional
 
 # --- 0. Setup Logging ---
 logger = logging.getLogger(__name__)
 
+# Sentinel for "key not present", so a single dict.get() replaces `in` + `get`.
+_MISSING = object()
+
+# Concrete mapping types loaders actually return; checked before the slower Mapping ABC.
+_CONCRETE_MAPPINGS = (dict, types.MappingProxyType)
+
+# Merged results of `load_sources_cached`, keyed by the tuple of source cache keys.
+# Oldest entries are evicted once the cache holds `_MERGED_CACHE_SIZE` results.
+_MERGED_CACHE: dict[tuple, dict[str, Any]] = {}
+_MERGED_CACHE_SIZE = 32
+_MERGED_CACHE_LOCK = threading.Lock()
 
 
 
 class ConfigLoader(abc.ABC):
     """Abstract base class for all configuration loaders."""
 
+    __slots__ = ()
+
     @abc.abstractmethod
     def load(self) -> Mapping[str, Any]:
         """
@@ -24,6 +41,15 @@ class ConfigLoader(abc.ABC):
         """
         pass
 
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Returns a hashable fingerprint of the source's current contents, used by
+        `load_sources_cached` to reuse merged results. It must change whenever
+        `load` would return different data. The default of None marks the
+        source as uncacheable.
+        """
+        return None
+
 
 # --- 2. The Deep Merge Utility ---
 
@@ -33,9 +59,13 @@ def deep_merge(source: Mapping, destination: dict) -> dict:
     Recursively merges a 'source' mapping into a 'destination' dictionary.
 
     - If a key exists in both and both values are mappings, it recurses.
-    - If a key in source has a dict value and the destination does not, it copies the dict.
+    - If a key in source has a dict value and the destination does not, it copies the dict
+      (including any nested dicts).
     - Otherwise, it overwrites the destination value with the source value.
 
+    Nested mappings are walked with an explicit stack rather than Python
+    recursion, so deeply nested configs cost no extra frames.
+
     Args:
         source: The mapping to merge from (read-only).
         destination: The dictionary to merge into (mutable).
@@ -43,19 +73,29 @@ def deep_merge(source: Mapping, destination: dict) -> dict:
     Returns:
         The mutated destination dictionary.
     """
-    for key, value in source.items():
-        if (
-            isinstance(value, Mapping)
-            and key in destination
-            and isinstance(destination.get(key), dict)
-        ):
-            # Recurse if both source and dest have dict-like value
-            deep_merge(value, destination[key])
-        elif isinstance(value, dict):
-            # If source has a dict and value doesn't, copy it
-            destination[key] = value.copy()
-        else:
-            destination[key] = value
+    if not source:
+        # Common for optional files that don't exist; nothing to merge.
+        return destination
+
+    stack = deque([(source, destination)])
+    while stack:
+        src, dst = stack.pop()
+        for key, value in src.items():
+            dst_value = dst.get(key, _MISSING)
+            # Check the destination first: the concrete dict test is cheap and
+            # fails for most keys. The ABC check is only a fallback for other mappings.
+            if isinstance(dst_value, dict) and (
+                isinstance(value, _CONCRETE_MAPPINGS) or isinstance(value, Mapping)
+            ):
+                # Descend if both source and dest have dict-like value
+                stack.append((value, dst_value))
+            elif isinstance(value, dict):
+                # If source has a dict and dest doesn't, copy it level by level
+                # so no nested dict is shared with the source.
+                dst[key] = subtree = {}
+                stack.append((value, subtree))
+            else:
+                dst[key] = value
     return destination
 
 
@@ -70,16 +110,95 @@ def load_sources(sources: list[ConfigLoader]) -> dict[str, Any]:
     Helper function to load and deep-merge all config sources.
     Load order matters: later sources in the list will override earlier ones.
     """
+    merged_config, _ = _load_sources_checked(sources)
+    # Return a final mutable dict for BaseSettings to consume
+    return merged_config
+
+
+def _load_sources_checked(sources: list[ConfigLoader]) -> tuple[dict[str, Any], bool]:
+    """
+    Does the work of `load_sources`, also reporting whether every source
+    loaded without raising.
+    """
     logger.debug(f"Loading configuration from {len(sources)} sources...")
     merged_config = {}
+    ok = True
     for loader in sources:
         try:
             config_data = loader.load()
             # Deep merge the immutable sources into our mutable dict
             merged_config = deep_merge(config_data, merged_config)
         except Exception as e:
+            ok = False
             logger.error(f"Unexpected error loading config from {loader}: {e}", exc_info=True)
 
     logger.debug("Finished loading and merging all sources.")
-    # Return a final mutable dict for BaseSettings to consume
+    return merged_config, ok
+
+
+def _cache_keys(sources: list[ConfigLoader]) -> Optional[tuple]:
+    """Returns the tuple of source cache keys, or None if any source is uncacheable."""
+    keys = []
+    for loader in sources:
+        key = loader.cache_key()
+        if key is None:
+            return None
+        keys.append(key)
+    return tuple(keys)
+
+
+def load_sources_cached(sources: list[ConfigLoader]) -> dict[str, Any]:
+    """
+    Like `load_sources`, but reuses the previous merged result while the cache key
+    of every source is unchanged. If any source is uncacheable, everything is
+    loaded as usual. Returns a deep copy, so callers may mutate the result freely.
+
+    Failed loads are never cached, so their errors are reported on every call: a
+    result is only stored if no source raised and every key is the same after
+    loading as before (a loader may drop its key when it fails quietly).
+    """
+    cache_key = _cache_keys(sources)
+    if cache_key is None:
+        return load_sources(sources)
+
+    with _MERGED_CACHE_LOCK:
+        merged_config = _MERGED_CACHE.get(cache_key)
+    if merged_config is None:
+        merged_config, ok = _load_sources_checked(sources)
+        if ok and _cache_keys(sources) == cache_key:
+            with _MERGED_CACHE_LOCK:
+                if len(_MERGED_CACHE) >= _MERGED_CACHE_SIZE:
+                    _MERGED_CACHE.pop(next(iter(_MERGED_CACHE)))
+                _MERGED_CACHE[cache_key] = merged_config
+    else:
+        logger.debug("Reusing cached configuration; no source has changed.")
+    return copy.deepcopy(merged_config)
+
+
+
+async def load_sources_async(sources: list[ConfigLoader]) -> dict[str, Any]:
+    """
+    Async counterpart of `load_sources` for applications running an event loop.
+    Each loader runs in a worker thread so the loop is never blocked; results are
+    merged in list order once all have finished.
+    """
+    logger.debug(f"Loading configuration from {len(sources)} sources (async)...")
+    results = await asyncio.gather(
+        *(asyncio.to_thread(loader.load) for loader in sources), return_exceptions=True
+    )
+
+    merged_config = {}
+    for loader, config_data in zip(sources, results):
+        if isinstance(config_data, BaseException):
+            if not isinstance(config_data, Exception):
+                # KeyboardInterrupt, SystemExit, cancellation: not a load failure
+                raise config_data
+            logger.error(
+                f"Unexpected error loading config from {loader}: {config_data}",
+                exc_info=config_data,
+            )
+            continue
+        merged_config = deep_merge(config_data, merged_config)
+
+    logger.debug("Finished loading and merging all sources.")
     return merged_config
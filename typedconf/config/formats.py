@@ -1,10 +1,14 @@
 """
 Configuration file formats and loaders.
 """
+import copy
+import functools
 import logging
+import mmap
+import os
 import types
 from pathlib import Path
-from typing import Any, Mapping, Union
+from typing import Any, Callable, Hashable, Mapping, Optional, Union
 
 from typedconf.config.core import ConfigLoader
 
@@ -21,15 +25,96 @@ except ImportError:
         )
         raise
 
+# --- Prefer the Rust-backed 'rtoml' parser when it is installed ---
+try:
+    import rtoml
+except ImportError:
+    rtoml = None
+
 logger = logging.getLogger(__name__)
 
+TomlParser = Callable[[bytes], Mapping[str, Any]]
+
+
+# The built-in parsers decode straight from any buffer (bytes or mmap).
+def _parse_with_tomllib(raw: bytes) -> Mapping[str, Any]:
+    return tomllib.loads(str(raw, "utf-8"))
+
+
+def _parse_with_rtoml(raw: bytes) -> Mapping[str, Any]:
+    return rtoml.loads(str(raw, "utf-8"))
+
+
+_DEFAULT_PARSER: TomlParser = _parse_with_rtoml if rtoml is not None else _parse_with_tomllib
+_BUFFER_PARSERS = frozenset({_parse_with_tomllib, _parse_with_rtoml})
+
+# Shared result for missing or unreadable files; safe to reuse because it is read-only.
+_EMPTY_MAPPING: Mapping[str, Any] = types.MappingProxyType({})
+
+# Files at least this large are memory-mapped rather than read into a bytes copy.
+# Below it, mmap setup costs more than the copy it saves.
+_MMAP_THRESHOLD = 64 * 1024
+
+# --- Parsed-file cache ---
+# Shared by every loader in the process. Keyed by (absolute path, mtime in ns,
+# size, parser) so an edited file naturally misses the cache. LRU-bounded;
+# override the size with TYPEDCONF_PARSE_CACHE_SIZE.
+_DEFAULT_PARSE_CACHE_SIZE = 128
+
+
+def _parse_cache_size_from_env() -> int:
+    """Reads TYPEDCONF_PARSE_CACHE_SIZE, falling back to the default if it isn't a valid size."""
+    raw = os.getenv("TYPEDCONF_PARSE_CACHE_SIZE")
+    if raw is None:
+        return _DEFAULT_PARSE_CACHE_SIZE
+    try:
+        size = int(raw)
+    except ValueError:
+        size = -1
+    if size < 0:
+        logger.warning(
+            f"Invalid TYPEDCONF_PARSE_CACHE_SIZE {raw!r}; using {_DEFAULT_PARSE_CACHE_SIZE}"
+        )
+        return _DEFAULT_PARSE_CACHE_SIZE
+    return size
+
+
+_PARSE_CACHE_SIZE = _parse_cache_size_from_env()
+
+
+@functools.lru_cache(maxsize=_PARSE_CACHE_SIZE)
+def _parse_file_cached(
+    path: str, mtime_ns: int, size: int, parser: TomlParser
+) -> Mapping[str, Any]:
+    """
+    Reads and parses a file. The result is shared by every caller, so it must never
+    be handed out directly; `TomlFileLoader.load` returns a copy.
+    """
+    # Read the whole file in one go; parsing an in-memory string is
+    # much faster than letting the parser pull from a file object.
+    with open(path, "rb") as f:
+        if size >= _MMAP_THRESHOLD and parser in _BUFFER_PARSERS:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                data = parser(mm)
+        else:
+            data = parser(f.read())
+    logger.debug(f"Successfully loaded config from {path}")
+    return data
+
 
 class TomlFileLoader(ConfigLoader):
     """
     Loads configuration from a TOML file.
     """
 
-    def __init__(self, file_path: Union[Path, str], required: bool = False):
+    __slots__ = ("file_path", "required", "parser", "_fspath", "_failed_key")
+
+    def __init__(
+        self,
+        file_path: Union[Path, str],
+        required: bool = False,
+        parser: Optional[TomlParser] = None,
+    ):
         """
         Initializes the loader.
 
@@ -37,35 +122,68 @@ class TomlFileLoader(ConfigLoader):
             file_path: The path to the TOML file.
             required: If True, a FileNotFoundError will be raised if the file doesn't exist.
                       If False, a missing file will be silently ignored.
+            parser: Callable turning the raw file bytes into a mapping. Defaults to
+                    'rtoml' if installed, otherwise the standard library 'tomllib'.
         """
-        self.file_path = Path(file_path)
+        self.file_path = file_path if isinstance(file_path, Path) else Path(file_path)
+        # Plain string form, used for syscalls to skip Path -> str conversion on each load.
+        self._fspath = os.fspath(self.file_path)
         self.required = required
+        self.parser = parser or _DEFAULT_PARSER
+        # Cache key of the last file state that failed to parse; see `cache_key`.
+        self._failed_key: Optional[Hashable] = None
 
     def load(self) -> Mapping[str, Any]:
         """
         Loads the TOML file.
 
         Returns:
-            A read-only mapping of the configuration data.
+            A read-only mapping of the configuration data. Parses are cached, but every
+            call returns its own copy, so nested tables are never shared between loads.
 
         Raises:
             FileNotFoundError: If the file is 'required' and does not exist.
         """
-        if not self.file_path.exists():
+        try:
+            st = os.stat(self._fspath)
+        except FileNotFoundError:
             if self.required:
-                raise FileNotFoundError(f"Required config file not found: {self.file_path}")
-            logger.debug(f"Optional config file not found, skipping: {self.file_path}")
-            return types.MappingProxyType({})
+                raise FileNotFoundError(f"Required config file not found: {self._fspath}")
+            logger.debug(f"Optional config file not found, skipping: {self._fspath}")
+            return _EMPTY_MAPPING
+
+        # abspath is pure string work; resolve() would lstat every path component.
+        path = os.path.abspath(self._fspath)
+        try:
+            data = _parse_file_cached(path, st.st_mtime_ns, st.st_size, self.parser)
+        except Exception as e:
+            self._failed_key = (path, st.st_mtime_ns, st.st_size, self.parser)
+            # Parsers raise their own error types, so catch broadly but report which one.
+            logger.warning(
+                f"Failed to load or parse TOML file {self._fspath}: {type(e).__name__}: {e}"
+            )
+            return _EMPTY_MAPPING
 
+        # Copy so nested tables are never shared with the cache or other loads, and
+        # wrap the copy in a read-only proxy to enforce immutability at the top level.
+        return types.MappingProxyType(copy.deepcopy(data))
+
+    def cache_key(self) -> Optional[Hashable]:
+        """
+        Fingerprints the file by its absolute path, modification time and size.
+        A missing optional file has a key too, so that creating it changes the key.
+        A missing required file, or a file that failed to parse as it is now, has
+        no key, so the error is reported again on every load instead of cached.
+        """
+        path = os.path.abspath(self._fspath)
         try:
-            with open(self.file_path, "rb") as f:
-                data = tomllib.load(f)
-                logger.debug(f"Successfully loaded config from {self.file_path}")
-                # Wrap the loaded dict in a read-only proxy to enforce immutability
-                return types.MappingProxyType(data)
-        except (tomllib.TOMLDecodeError, OSError) as e:
-            logger.warning(f"Failed to load or parse TOML file {self.file_path}: {e}")
-            return types.MappingProxyType({})
+            st = os.stat(self._fspath)
+        except FileNotFoundError:
+            return None if self.required else (path, None, None, self.parser)
+        except OSError:
+            return None
+        key = (path, st.st_mtime_ns, st.st_size, self.parser)
+        return None if key == self._failed_key else key
 
     def __repr__(self) -> str:
-        return f"TomlFileLoader(file_path='{self.file_path}', required={self.required})"
+        return f"TomlFileLoader(file_path='{self._fspath}', required={self.required})"
@@ -2,19 +2,67 @@
 User-facing configuration base classes.
 """
 
+import inspect
 import logging
 import os
-from typing import Any, ClassVar, List
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, ClassVar, List, Optional, Self
 
-from typedconf.config.core import ConfigLoader, load_sources
+from typedconf.config.core import ConfigLoader, load_sources_cached
 from typedconf.config.formats import TomlFileLoader
-from typedconf.config.schema import Config, ConfigDict, ConfigModel, Field
+from typedconf.config.schema import (
+    Config,
+    ConfigDict,
+    ConfigModel,
+    Field,
+    SettingsSource,
+)
 
 logger = logging.getLogger(__name__)
 
+# Default loader lists, built once per environment and shared by all config classes.
+_DEFAULT_SOURCES: dict[str, List[ConfigLoader]] = {}
+
+# Set by `AppConfig.reconfigure` to load for an environment other than APP_ENV.
+_ENV_OVERRIDE: ContextVar[Optional[str]] = ContextVar("typedconf_env_override", default=None)
+
+
+class _FileSettingsSource(SettingsSource):
+    """
+    Settings source for the merged config files.
+
+    Files are only read when pydantic-settings calls the source, and are skipped
+    entirely when higher-priority sources already set every field outright.
+    """
+
+    def __init__(self, settings_cls: type[Config], sources: List[ConfigLoader]):
+        super().__init__(settings_cls)
+        self.sources = sources
+
+    def get_field_value(self, field: Any, field_name: str) -> tuple[Any, str, bool]:
+        # Unused: values come from the merged files as a whole in __call__
+        return None, field_name, False
+
+    def __call__(self) -> dict[str, Any]:
+        state = self.current_state
+        # A dict may be a partial nested value that the files still complete
+        if all(
+            name in state and not isinstance(state[name], dict)
+            for name in self.settings_cls.model_fields
+        ):
+            logger.debug("All fields set by higher-priority sources; skipping config files.")
+            return {}
+        # The merged result is reused while none of the files have changed. It must be
+        # a copy: validated values (e.g. fields typed Any) can alias the source dicts.
+        return load_sources_cached(self.sources)
+
 
 class LanguageModelConfig(ConfigModel):
     """LLM model configuration. Provided as a convenience."""
+
+    # Immutable (and so hashable): models derive request parameters from it once.
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(..., description="The model Id, like gpt-3.5-turbo")
     top_p: float = 10
     max_tokens: int = 100
@@ -41,12 +89,66 @@ class AppConfig(Config):
 
     # --- Framework: Define Configuration Sources ---
     # This list can be overridden by subclasses to customize config loading.
-    # The default setup implements a common pattern:
+    # When left empty, the default setup implements a common pattern:
     # 1. A required base configuration file.
     # 2. An optional environment-specific file (e.g., 'config.production.toml').
     # 3. An optional local override file (for development, not in git).
     config_sources: ClassVar[List[ConfigLoader]] = []
 
+    # The arguments this instance was constructed with; used by `reconfigure`.
+    _init_kwargs: dict[str, Any] = {}
+
+    if not TYPE_CHECKING:
+        # Hidden from type checkers so they keep pydantic's synthesized signature.
+        # At runtime it borrows BaseSettings' own signature, so pydantic still
+        # derives the full one (fields plus settings arguments) for `inspect`.
+        def __init__(self, **values: Any) -> None:
+            super().__init__(**values)
+            self._init_kwargs = values
+
+        __init__.__signature__ = inspect.signature(Config.__init__)
+
+    # --- Framework: Environment-specific sources ---
+
+    @staticmethod
+    def _current_env() -> str:
+        """Returns the active environment from APP_ENV, defaulting to 'development'."""
+        override = _ENV_OVERRIDE.get()
+        if override is not None:
+            return override
+        return os.getenv("APP_ENV", "development").lower()
+
+    @classmethod
+    def _sources_for(cls, env: str) -> List[ConfigLoader]:
+        """
+        Returns the loaders, in load order, for the given environment: the class's
+        own `config_sources` if it sets any, otherwise the default file layout.
+        """
+        if cls.config_sources:
+            return cls.config_sources
+        sources = _DEFAULT_SOURCES.get(env)
+        if sources is None:
+            sources = _DEFAULT_SOURCES.setdefault(env, [
+                TomlFileLoader("config.default.toml", required=True),
+                TomlFileLoader(f"config.{env}.toml", required=False),
+                TomlFileLoader("config.local.toml", required=False),
+            ])
+        return sources
+
+    def reconfigure(self, env: str) -> Self:
+        """
+        Returns a new config loaded for another environment.
+
+        This is exactly a fresh load with APP_ENV set to 'env' and the same init
+        arguments: every source is read and the whole config validated again.
+        APP_ENV itself is left untouched.
+        """
+        token = _ENV_OVERRIDE.set(env.lower())
+        try:
+            return type(self)(**self._init_kwargs)
+        finally:
+            _ENV_OVERRIDE.reset(token)
+
     # --- Framework: Pydantic Integration ---
 
     @classmethod
@@ -66,19 +168,16 @@ class AppConfig(Config):
 
         # 1. Determine the current environment (e.g., 'development', 'production')
         # Defaults to 'development' if not set.
-        env = os.getenv("APP_ENV", "development").lower()
+        env = cls._current_env()
         logger.debug("Current APP_ENV: %s", env)
 
-        # 2. Define the file load order using the class variable
-        # This makes the behavior extensible. Subclasses can just change `config_sources`.
-        cls.config_sources = [
-            TomlFileLoader("config.default.toml", required=True),
-            TomlFileLoader(f"config.{env}.toml", required=False),
-            TomlFileLoader("config.local.toml", required=False),
-        ]
+        # 2. Resolve the file load order. Subclasses can just set `config_sources`;
+        # otherwise the default loaders for this environment are reused across calls.
+        sources = cls._sources_for(env)
 
-        # 3. Use the helper to load and merge all file-based sources
-        merged_file_config = load_sources(cls.config_sources)
+        # 3. Wrap the file-based sources; they are loaded and merged lazily,
+        # only once Pydantic asks for them.
+        file_settings = _FileSettingsSource(settings_cls, sources)
 
         # 4. Return all sources to Pydantic.
         # The order determines priority (earlier sources win).
@@ -93,5 +192,5 @@ class AppConfig(Config):
             env_settings,
             dotenv_settings,
             file_secret_settings,
-            lambda: merged_file_config,
+            file_settings,
         )
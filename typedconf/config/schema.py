@@ -6,9 +6,11 @@ This allows the library to change its internal implementation without breaking u
 from typing import Any
 
 from pydantic import BaseModel as PydanticBaseModel
+from pydantic import ConfigDict as PydanticConfigDict
 from pydantic import Field as PydanticField
 from pydantic import ValidationError as PydanticValidationError
 from pydantic_settings import BaseSettings as PydanticBaseSettings
+from pydantic_settings import PydanticBaseSettingsSource
 from pydantic_settings import SettingsConfigDict as PydanticSettingsConfigDict
 
 
@@ -19,7 +21,10 @@ class ConfigModel(PydanticBaseModel):
     Users should extend this class for nested configuration objects.
     This is a facade over Pydantic's BaseModel.
     """
-    pass
+
+    # Build validators/serializers on first use rather than at class creation,
+    # so importing a schema that is never instantiated stays cheap.
+    model_config = PydanticConfigDict(defer_build=True)
 
 
 class Config(PydanticBaseSettings):
@@ -29,7 +34,8 @@ class Config(PydanticBaseSettings):
     Users should extend this class for their main configuration class.
     This is a facade over Pydantic's BaseSettings.
     """
-    pass
+
+    model_config = PydanticSettingsConfigDict(defer_build=True)
 
 
 class ConfigDict(PydanticSettingsConfigDict):
@@ -44,6 +50,8 @@ class ConfigDict(PydanticSettingsConfigDict):
 # Re-export common types so users don't need to import from Pydantic
 Field = PydanticField
 ValidationError = PydanticValidationError
+# Internal: base class for typedconf's own settings sources, not part of the public API
+SettingsSource = PydanticBaseSettingsSource
 
 
 __all__ = ["ConfigModel", "Config", "ConfigDict", "Field", "ValidationError"]
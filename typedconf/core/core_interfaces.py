@@ -1,20 +1,24 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 from typing import Any, Dict, List, Optional
 
-class MessageRole(Enum):
+# Upper bound on concurrent requests made by `LanguageModel.invoke_batch`.
+_MAX_BATCH_WORKERS = 8
+
+class MessageRole(str, Enum):
     USER = "user"
     ASSISTANT = "assistant"
     SYSTEM = "system"
     
-@dataclass
+@dataclass(slots=True)
 class ChatMessage:
     role: MessageRole
     content: str
     metadata: Optional[Dict[str, Any]] = None
 
-@dataclass
+@dataclass(slots=True)
 class ChatResponse:
     content: str
     model: str
@@ -27,3 +31,14 @@ class LanguageModel(ABC):
     @abstractmethod
     def invoke(self, messages: List[ChatMessage], **kwargs) -> ChatResponse:
         pass
+
+    def invoke_batch(self, conversations: List[List[ChatMessage]], **kwargs) -> List[ChatResponse]:
+        """
+        Invokes the model on several independent conversations concurrently.
+        Calls are network-bound, so total time approaches the slowest call rather than
+        the sum of all of them. Responses are returned in the order of 'conversations'.
+        """
+        if len(conversations) <= 1:
+            return [self.invoke(messages, **kwargs) for messages in conversations]
+        with ThreadPoolExecutor(max_workers=min(_MAX_BATCH_WORKERS, len(conversations))) as executor:
+            return list(executor.map(lambda messages: self.invoke(messages, **kwargs), conversations))
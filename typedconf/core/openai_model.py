@@ -1,5 +1,10 @@
+import copy
+import dataclasses
+import functools
+import hashlib
+import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, MutableMapping, Optional
 
 import openai
 from openai.types.chat import ChatCompletion
@@ -12,35 +17,87 @@ from typedconf.core.core_interfaces import (
 )
 
 
+@functools.lru_cache(maxsize=16)
+def _shared_client(api_key: str) -> openai.Client:
+    """
+    One client per explicit API key (for the most recently used keys), so models
+    share its keep-alive connection pool instead of redoing TCP/TLS handshakes.
+    """
+    return openai.Client(api_key=api_key)
+
+
+def _copy_response(response: ChatResponse, **changes: Any) -> ChatResponse:
+    """Copies a response, including its usage and metadata dicts, so the cache never shares them."""
+    return dataclasses.replace(
+        response,
+        usage=copy.deepcopy(response.usage),
+        metadata=copy.deepcopy(response.metadata),
+        **changes,
+    )
+
+
 class OpenAILanguageModel(LanguageModel):
-    def __init__(self, model_config: LanguageModelConfig, api_key: Optional[str] = None):
-        self.client = openai.Client(api_key=api_key)
+    def __init__(
+        self,
+        model_config: LanguageModelConfig,
+        api_key: Optional[str] = None,
+        client: Optional[openai.Client] = None,
+        cache: Optional[MutableMapping[bytes, ChatResponse]] = None,
+    ):
+        # Models given the same explicit api_key share one client. Without a key each
+        # model gets its own client, so it picks up OPENAI_API_KEY/OPENAI_BASE_URL as
+        # they are when the model is created.
+        if client is not None:
+            self.client = client
+        elif api_key is not None:
+            self.client = _shared_client(api_key)
+        else:
+            self.client = openai.Client()
         self.model_config = model_config
+        # Optional response cache, only consulted for deterministic (temperature 0) calls
+        self.cache = cache
+        # Request parameters derived from the config, built once rather than per call
+        self._base_params = {
+            "model": model_config.id,
+            "temperature": model_config.temperature,
+            "max_tokens": model_config.max_tokens,
+            "top_p": model_config.top_p,
+        }
 
     def invoke(self, messages: List[ChatMessage], **kwargs) -> ChatResponse:
         openai_messages = [
-            {"role": msg.role.value, "content": msg.content} for msg in messages
+            # MessageRole is a str enum, so members serialize as their role string
+            {"role": msg.role, "content": msg.content} for msg in messages
         ]
 
-        # Merge model config with any additional kwargs
-        api_params = {
-            "model": self.model_config.id,
-            "temperature": self.model_config.temperature,
-            "max_tokens": self.model_config.max_tokens,
-            "top_p": self.model_config.top_p,
-            **kwargs,  # Allow overrides via kwargs
-        }
+        # Merge model config with any additional kwargs (allows overrides via kwargs)
+        api_params = {**self._base_params, **kwargs} if kwargs else self._base_params
+
+        start_time = time.perf_counter()
+        cache_key = None
+        if self.cache is not None and api_params["temperature"] == 0:
+            try:
+                request = json.dumps([openai_messages, api_params], sort_keys=True)
+            except TypeError:
+                # Parameters that aren't plain JSON have no reliable key; don't cache
+                request = None
+            if request is not None:
+                cache_key = hashlib.blake2b(request.encode()).digest()
+                cached = self.cache.get(cache_key)
+                if cached is not None:
+                    return _copy_response(
+                        cached, response_time=time.perf_counter() - start_time
+                    )
 
-        start_time = time.time()
         response: ChatCompletion = self.client.chat.completions.create(
             messages=openai_messages,
             **api_params,
         )
-        end_time = time.time()
+        end_time = time.perf_counter()
 
         choice = response.choices[0]
         
-        return ChatResponse(
+        chat_response = ChatResponse(
             content=choice.message.content or "",
             model=response.model,
             usage=response.usage.model_dump() if response.usage else None,
@@ -48,3 +105,6 @@ class OpenAILanguageModel(LanguageModel):
             finish_reason=choice.finish_reason,
             metadata={"system_fingerprint": response.system_fingerprint},
         )
+        if cache_key is not None:
+            self.cache[cache_key] = _copy_response(chat_response)
+        return chat_response